@@ -52,9 +52,12 @@ def get_parameter_vector(param_size,
             if not zero_offset:
                 param_vec[col] = 1
         else:
-            value = param_id_to_value_fn(param_id).flatten(order='F')
+            value = np.asarray(param_id_to_value_fn(param_id))
             size = param_id_to_size[param_id]
-            param_vec[col:col + size] = value
+            # write through a column-major view of the destination, so that
+            # the value is copied only once, into param_vec
+            np.reshape(param_vec[col:col + size], value.shape,
+                       order='F')[...] = value
     return param_vec
 
 
@@ -107,17 +110,10 @@ def reduce_problem_data_tensor(A, var_length, quad_form=False):
     # construct a reduced COO matrix
     A.eliminate_zeros()
     A_coo = A.tocoo()
-    unique_old_row = np.sort(np.unique(A_coo.row))
-    old_row_to_new_row = {
-        unique_old_row[i]: i for i in range(unique_old_row.size)
-    }
+    # remap the rows; np.unique returns the sorted unique rows, and the
+    # inverse maps each old row to its index among them
+    unique_old_row, reduced_row = np.unique(A_coo.row, return_inverse=True)
     reduced_A_shape = (unique_old_row.size, A_coo.shape[1])
-
-    # remap the rows
-    old_row = A_coo.row
-    reduced_row = np.zeros(old_row.shape)
-    for i in range(reduced_row.size):
-        reduced_row[i] = old_row_to_new_row[old_row[i]]
     reduced_A = scipy.sparse.coo_matrix(
         (A_coo.data, (reduced_row, A_coo.col)), shape=reduced_A_shape)
 
@@ -136,25 +132,10 @@ def reduce_problem_data_tensor(A, var_length, quad_form=False):
     # cols holds the column corresponding to each row in nonzero_rows
     cols = nonzero_rows // n_constr
 
-    # construction of the indptr: scan through cols, and find
-    # the structure of the column index pointer
-    indptr = np.zeros(n_cols + 1, dtype=np.int32)
-    i = 0
-    j = 1
-    nnz = cols.size
-    prev_col = 0
-    while i < nnz:
-        col = cols[i]
-        while col == prev_col and i < nnz - 1:
-            i += 1
-            col = cols[i]
-        if prev_col != col:
-            for k in range(col - prev_col):
-                indptr[j + k] = i
-            j += col - prev_col
-        prev_col = col
-        i += 1
-    indptr[j:] = nnz
+    # construction of the indptr: cols is sorted, so the start of column k
+    # is the number of entries that lie in columns before k
+    indptr = np.searchsorted(
+        cols, np.arange(n_cols + 1), side='left').astype(np.int32)
     return reduced_A, indices, indptr, shape
 
 
@@ -234,22 +215,33 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
         flat_problem_data = problem_data_tensor @ param_vec
 
 
-    if problem_data_index is not None:
+    if problem_data_index is not None and with_offset:
+        # The offset is the last column of the problem data matrix. Scatter
+        # its entries into a dense vector and build A from the leading
+        # columns, instead of forming the full matrix and slicing it.
+        indices, indptr, shape = problem_data_index
+        offset_start = indptr[-2]
+        A = scipy.sparse.csc_matrix(
+            (flat_problem_data[:offset_start], indices[:offset_start],
+             indptr[:-1]), shape=(shape[0], shape[1] - 1))
+        b = np.zeros(shape[0])
+        b[indices[offset_start:]] = flat_problem_data[offset_start:]
+    elif problem_data_index is not None:
         indices, indptr, shape = problem_data_index
-        M = scipy.sparse.csc_matrix(
+        A = scipy.sparse.csc_matrix(
             (flat_problem_data, indices, indptr), shape=shape)
+        b = None
     else:
         n_cols = var_length
         if with_offset:
             n_cols += 1
         M = flat_problem_data.reshape((-1, n_cols), order='F').tocsc()
-
-    if with_offset:
-        A = M[:, :-1].tocsc()
-        b = np.squeeze(M[:, -1].toarray().flatten())
-    else:
-        A = M.tocsc()
-        b = None
+        if with_offset:
+            A = M[:, :-1].tocsc()
+            b = np.squeeze(M[:, -1].toarray().flatten())
+        else:
+            A = M
+            b = None
 
     if nonzero_rows is not None and nonzero_rows.size > 0:
         A_nrows, _ = A.shape
@@ -263,6 +255,32 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
     return (A, b)
 
 
+def get_vector_from_tensor(problem_data_tensor, param_vec):
+    """Applies problem_data_tensor to param_vec to obtain a vector and offset.
+
+    This is a specialization of get_matrix_from_tensor for tensors that
+    represent a scalar affine expression c'x + d, such as an objective. The
+    result is formed densely, without building and slicing a sparse matrix.
+
+    Parameters
+    ----------
+        problem_data_tensor: tensor returned from get_problem_matrix,
+            representing a parameterized scalar affine expression
+        param_vec: flattened parameter vector
+
+    Returns
+    -------
+        A tuple (c, d), where c is a flattened NumPy array with one entry
+        per variable and d is the scalar constant offset.
+    """
+    if param_vec is None:
+        flat_problem_data = problem_data_tensor.toarray()
+    else:
+        flat_problem_data = problem_data_tensor @ param_vec
+    flat_problem_data = np.asarray(flat_problem_data).flatten()
+    return flat_problem_data[:-1], flat_problem_data[-1]
+
+
 def get_matrix_and_offset_from_unparameterized_tensor(problem_data_tensor,
                                                       var_length):
     """Converts unparameterized tensor to matrix offset representation
@@ -12,6 +12,34 @@ int vecprod_before(const std::vector<int> &vec, int end) {
                          std::multiplies<int>());
 }
 
+// Returns true if mat is a square identity matrix.
+bool is_identity(const Matrix &mat) {
+  if (mat.rows() != mat.cols() || mat.nonZeros() != mat.rows()) {
+    return false;
+  }
+  for (int k = 0; k < mat.outerSize(); ++k) {
+    for (Matrix::InnerIterator it(mat, k); it; ++it) {
+      if (it.row() != it.col() || it.value() != 1) {
+        return false;
+      }
+    }
+  }
+  return true;
+}
+
+// Multiply two matrices, skipping the sparse product when
+// either factor is empty or an identity.
+Matrix mat_mul(const Matrix &lh, const Matrix &rh) {
+  if (lh.nonZeros() == 0 || rh.nonZeros() == 0) {
+    return Matrix(lh.rows(), rh.cols());
+  } else if (is_identity(lh)) {
+    return rh;
+  } else if (is_identity(rh)) {
+    return lh;
+  }
+  return lh * rh;
+}
+
 // multiply two vectors of matrices
 // get a new vector of matrices
 std::vector<Matrix> mat_vec_mul(const std::vector<Matrix> &lh_vec,
@@ -22,7 +50,7 @@ std::vector<Matrix> mat_vec_mul(const std::vector<Matrix> &lh_vec,
   result.reserve(lh_vec.size() * rh_vec.size());
   for (unsigned i = 0; i < lh_vec.size(); ++i) {
     for (unsigned j = 0; j < rh_vec.size(); ++j) {
-      result.push_back(lh_vec[i] * rh_vec[j]);
+      result.push_back(mat_mul(lh_vec[i], rh_vec[j]));
     }
   }
   return result;
@@ -238,6 +238,7 @@ class Expression(u.Canonical):
         """
         return NotImplemented
 
+    @perf.compute_once
     def is_dgp(self, dpp=False):
         """Checks whether the Expression is log-log DCP.
 
@@ -70,9 +70,12 @@ def sparse2cvxopt(value):
         return cvxopt.sparse(cvxopt.matrix(value.astype('float64')), tc='d')
     # Convert scipy sparse matrices to coo form first.
     elif sp.issparse(value):
+        # Pass the COO arrays through the buffer protocol rather than
+        # building intermediate Python lists.
         value = value.tocoo()
-        return cvxopt.spmatrix(value.data.tolist(), value.row.tolist(),
-                               value.col.tolist(), size=value.shape, tc='d')
+        return cvxopt.spmatrix(cvxopt.matrix(value.data.astype('float64')),
+                               cvxopt.matrix(value.row), cvxopt.matrix(value.col),
+                               size=value.shape, tc='d')
 
 
 def dense2cvxopt(value):
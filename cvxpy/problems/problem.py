@@ -32,6 +32,7 @@ from cvxpy.constraints import Equality, Inequality, NonPos, Zero, NonNeg
 import cvxpy.utilities as u
 
 from collections import namedtuple
+import itertools
 import numpy as np
 import time
 import warnings
@@ -48,6 +49,11 @@ class Cache(object):
         self.solving_chain = None
         self.param_prog = None
         self.inverse_data = None
+        # Compiled state for the previous key, as
+        # (solver name, gp, solving chain, param prog, inverse data).
+        self._previous = None
+        # The state of the key that was just switched away from.
+        self._switched_from = None
 
     def invalidate(self):
         self.key = None
@@ -55,6 +61,40 @@ class Cache(object):
         self.param_prog = None
         self.inverse_data = None
 
+    def switch_to(self, key):
+        """Makes key the current key; call `restore_previous` once its
+        solving chain has been constructed.
+        """
+        self._switched_from = None
+        if self.solving_chain is not None:
+            self._switched_from = (
+                self.solving_chain.solver.name(), self.gp(),
+                self.solving_chain, self.param_prog, self.inverse_data)
+        self.key = key
+        self.solving_chain = None
+        self.param_prog = None
+        self.inverse_data = None
+
+    def restore_previous(self):
+        """Reuses compiled state that targets the same solver as the current
+        solving chain (e.g., when alternating between two solvers, or when
+        solver=None resolves to a solver that was named before).
+
+        Only the state for one previous key is kept.
+        """
+        switched_from, self._switched_from = self._switched_from, None
+        target = (self.solving_chain.solver.name(), self.gp())
+        if switched_from is not None and switched_from[:2] == target:
+            _, _, self.solving_chain, self.param_prog, self.inverse_data = (
+                switched_from)
+            return
+        if self._previous is not None and self._previous[:2] == target:
+            _, _, self.solving_chain, self.param_prog, self.inverse_data = (
+                self._previous)
+            self._previous = None
+        if switched_from is not None:
+            self._previous = switched_from
+
     def make_key(self, solver, gp):
         return (solver, gp)
 
@@ -142,6 +182,10 @@ class Problem(u.Canonical):
         """
         return self._constraints[:]
 
+    def _objective_and_constraints(self):
+        """Iterates over the objective, then the constraints."""
+        return itertools.chain([self._objective], self._constraints)
+
     @perf.compute_once
     def is_dcp(self, dpp=False):
         """Does the problem satisfy DCP rules?
@@ -163,7 +207,7 @@ class Problem(u.Canonical):
             True if the Expression is DCP, False otherwise.
         """
         return all(
-          expr.is_dcp(dpp) for expr in self.constraints + [self.objective])
+          expr.is_dcp(dpp) for expr in self._objective_and_constraints())
 
     @perf.compute_once
     def is_dgp(self, dpp=False):
@@ -186,14 +230,14 @@ class Problem(u.Canonical):
             True if the Expression is DGP, False otherwise.
         """
         return all(
-          expr.is_dgp(dpp) for expr in self.constraints + [self.objective])
+          expr.is_dgp(dpp) for expr in self._objective_and_constraints())
 
     @perf.compute_once
     def is_dqcp(self):
         """Does the problem satisfy the DQCP rules?
         """
         return all(
-          expr.is_dqcp() for expr in self.constraints + [self.objective])
+          expr.is_dqcp() for expr in self._objective_and_constraints())
 
     @perf.compute_once
     def is_dpp(self, context='dcp'):
@@ -252,10 +296,8 @@ class Problem(u.Canonical):
         list of :class:`~cvxpy.expressions.variable.Variable`
             A list of the variables in the problem.
         """
-        vars_ = self.objective.variables()
-        for constr in self.constraints:
-            vars_ += constr.variables()
-        return unique_list(vars_)
+        return unique_list(itertools.chain.from_iterable(
+            expr.variables() for expr in self._objective_and_constraints()))
 
     @perf.compute_once
     def parameters(self):
@@ -266,10 +308,8 @@ class Problem(u.Canonical):
         list of :class:`~cvxpy.expressions.constants.parameter.Parameter`
             A list of the parameters in the problem.
         """
-        params = self.objective.parameters()
-        for constr in self.constraints:
-            params += constr.parameters()
-        return unique_list(params)
+        return unique_list(itertools.chain.from_iterable(
+            expr.parameters() for expr in self._objective_and_constraints()))
 
     @perf.compute_once
     def constants(self):
@@ -280,10 +320,8 @@ class Problem(u.Canonical):
         list of :class:`~cvxpy.expressions.constants.constant.Constant`
             A list of the constants in the problem.
         """
-        const_dict = {}
-        constants_ = self.objective.constants()
-        for constr in self.constraints:
-            constants_ += constr.constants()
+        constants_ = itertools.chain.from_iterable(
+            expr.constants() for expr in self._objective_and_constraints())
         # Note that numpy matrices are not hashable, so we use the built-in
         # function "id"
         const_dict = {id(constant): constant for constant in constants_}
@@ -298,10 +336,8 @@ class Problem(u.Canonical):
             A list of the atom types in the problem; note that this list
             contains classes, not instances.
         """
-        atoms = self.objective.atoms()
-        for constr in self.constraints:
-            atoms += constr.atoms()
-        return unique_list(atoms)
+        return unique_list(itertools.chain.from_iterable(
+            expr.atoms() for expr in self._objective_and_constraints()))
 
     @property
     def size_metrics(self):
@@ -495,12 +531,13 @@ class Problem(u.Canonical):
         """
         key = self._cache.make_key(solver, gp)
         if key != self._cache.key:
-            self._cache.invalidate()
-            solving_chain = self._construct_chain(
-                solver=solver, gp=gp, enforce_dpp=enforce_dpp)
-            self._cache.key = key
-            self._cache.solving_chain = solving_chain
+            self._cache.switch_to(key)
             self._solver_cache = {}
+        if self._cache.solving_chain is None:
+            self._cache.solving_chain = self._construct_chain(
+                solver=solver, gp=gp, enforce_dpp=enforce_dpp)
+            self._cache.restore_previous()
+            solving_chain = self._cache.solving_chain
         else:
             solving_chain = self._cache.solving_chain
 
@@ -66,7 +66,8 @@ class Canonicalization(Reduction):
             # constraint
             canon_constr, aux_constr = self.canonicalize_tree(
                 constraint)
-            canon_constraints += aux_constr + [canon_constr]
+            canon_constraints.extend(aux_constr)
+            canon_constraints.append(canon_constr)
             inverse_data.cons_id_map.update({constraint.id: canon_constr.id})
 
         new_problem = problems.problem.Problem(canon_objective,
@@ -91,16 +92,17 @@ class Canonicalization(Reduction):
               expr.args[0].objective.expr)
             for constr in expr.args[0].constraints:
                 canon_constr, aux_constr = self.canonicalize_tree(constr)
-                constrs += [canon_constr] + aux_constr
+                constrs.append(canon_constr)
+                constrs.extend(aux_constr)
         else:
             canon_args = []
             constrs = []
             for arg in expr.args:
                 canon_arg, c = self.canonicalize_tree(arg)
-                canon_args += [canon_arg]
-                constrs += c
+                canon_args.append(canon_arg)
+                constrs.extend(c)
             canon_expr, c = self.canonicalize_expr(expr, canon_args)
-            constrs += c
+            constrs.extend(c)
         return canon_expr, constrs
 
     def canonicalize_expr(self, expr, args):
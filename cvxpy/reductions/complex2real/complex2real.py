@@ -80,8 +80,8 @@ class Complex2Real(Reduction):
                 elif var.is_complex() and var.is_hermitian():
                     imag_id = inverse_data.real2imag[vid]
                     # Imaginary part may have been lost.
-                    if imag_id in solution.primal_vars:
-                        imag_val = solution.primal_vars[imag_id]
+                    imag_val = solution.primal_vars.get(imag_id)
+                    if imag_val is not None:
                         pvars[vid] = solution.primal_vars[vid] + \
                             1j*(imag_val - imag_val.T)/2
                     else:
@@ -89,9 +89,9 @@ class Complex2Real(Reduction):
                 elif var.is_complex():
                     imag_id = inverse_data.real2imag[vid]
                     # Imaginary part may have been lost.
-                    if imag_id in solution.primal_vars:
-                        pvars[vid] = solution.primal_vars[vid] + \
-                            1j*solution.primal_vars[imag_id]
+                    imag_val = solution.primal_vars.get(imag_id)
+                    if imag_val is not None:
+                        pvars[vid] = solution.primal_vars[vid] + 1j*imag_val
                     else:
                         pvars[vid] = solution.primal_vars[vid]
             for cid, cons in inverse_data.id2cons.items():
@@ -106,9 +106,9 @@ class Complex2Real(Reduction):
                                  NonNeg, NonPos)
                                 ) and cons.is_complex():
                     imag_id = inverse_data.real2imag[cid]
-                    if imag_id in solution.dual_vars:
-                        dvars[cid] = solution.dual_vars[cid] + \
-                            1j*solution.dual_vars[imag_id]
+                    imag_val = solution.dual_vars.get(imag_id)
+                    if imag_val is not None:
+                        dvars[cid] = solution.dual_vars[cid] + 1j*imag_val
                     else:
                         dvars[cid] = solution.dual_vars[cid]
                 elif isinstance(cons, SOC) and cons.is_complex():
@@ -28,6 +28,7 @@ from cvxpy.reductions.utilities import (are_args_affine,
                                         lower_ineq_to_nonneg)
 import cvxpy.settings as s
 from cvxpy.utilities.coeff_extractor import CoeffExtractor
+from cvxpy.utilities import performance_utils as perf
 import numpy as np
 import scipy.sparse as sp
 
@@ -115,18 +116,6 @@ class ParamConeProg(ParamProb):
         # The variable
         self.x = x
 
-        # Form a reduced representation of A, for faster application of
-        # parameters.
-        if np.prod(A.shape) != 0:
-            reduced_A, indices, indptr, shape = (
-                canonInterface.reduce_problem_data_tensor(A, self.x.size)
-            )
-            self.reduced_A = reduced_A
-            self.problem_data_index = (indices, indptr, shape)
-        else:
-            self.reduced_A = A
-            self.problem_data_index = None
-
         self._A_mapping_nonzero = None
 
         self.constraints = constraints
@@ -152,6 +141,36 @@ class ParamConeProg(ParamProb):
         return self.x.attributes['boolean'] or \
             self.x.attributes['integer']
 
+    @perf.lazyprop
+    def _reduced_A(self):
+        """A reduced representation of A, for faster application of parameters.
+
+        This is only formed when parameters are first applied, since a program
+        that is reformatted for a solver never has its parameters applied.
+
+        Returns
+        -------
+        tuple
+            (reduced_A, problem_data_index)
+        """
+        if np.prod(self.A.shape) != 0:
+            reduced_A, indices, indptr, shape = (
+                canonInterface.reduce_problem_data_tensor(self.A, self.x.size)
+            )
+            return reduced_A, (indices, indptr, shape)
+        else:
+            return self.A, None
+
+    @property
+    def reduced_A(self):
+        """The reduced representation of the problem data tensor A."""
+        return self._reduced_A[0]
+
+    @property
+    def problem_data_index(self):
+        """CSC (indices, indptr, shape) for the matrix formed from reduced_A."""
+        return self._reduced_A[1]
+
     def apply_parameters(self, id_to_param_value=None, zero_offset=False,
                          keep_zeros=False):
         """Returns A, b after applying parameters (and reshaping).
@@ -164,7 +183,7 @@ class ParamConeProg(ParamProb):
                         parameters are affected
         """
         def param_value(idx):
-            return (np.array(self.id_to_param[idx].value) if id_to_param_value
+            return (np.asarray(self.id_to_param[idx].value) if id_to_param_value
                     is None else id_to_param_value[idx])
         param_vec = canonInterface.get_parameter_vector(
             self.total_param_size,
@@ -172,9 +191,7 @@ class ParamConeProg(ParamProb):
             self.param_id_to_size,
             param_value,
             zero_offset=zero_offset)
-        c, d = canonInterface.get_matrix_from_tensor(
-            self.c, param_vec, self.x.size, with_offset=True)
-        c = c.toarray().flatten()
+        c, d = canonInterface.get_vector_from_tensor(self.c, param_vec)
         if keep_zeros and self._A_mapping_nonzero is None:
             self._A_mapping_nonzero = canonInterface.A_mapping_nonzero_rows(
                 self.A, self.x.size)
@@ -225,7 +242,9 @@ class ParamConeProg(ParamProb):
         """Splits the solution into individual variables.
         """
         if active_vars is None:
-            active_vars = [v.id for v in self.variables]
+            active_vars = self.id_to_var.keys()
+        else:
+            active_vars = set(active_vars)
         # var id to solution.
         sltn_dict = {}
         for var_id, col in self.var_id_to_col.items():
@@ -326,7 +345,7 @@ class ConeMatrixStuffing(MatrixStuffing):
 
     def invert(self, solution, inverse_data):
         """Retrieves a solution to the original problem"""
-        var_map = inverse_data.var_offsets
+        var_map = inverse_data.id_map
         con_map = inverse_data.cons_id_map
         # Flip sign of opt val if maximize.
         opt_val = solution.opt_val
@@ -340,9 +359,8 @@ class ConeMatrixStuffing(MatrixStuffing):
 
         # Split vectorized variable into components.
         x_opt = list(solution.primal_vars.values())[0]
-        for var_id, offset in var_map.items():
+        for var_id, (offset, size) in var_map.items():
             shape = inverse_data.var_shapes[var_id]
-            size = np.prod(shape, dtype=int)
             primal_vars[var_id] = np.reshape(x_opt[offset:offset+size], shape,
                                              order='F')
 
@@ -76,12 +76,10 @@ class Dqcp2Dcp(Canonicalization):
         return type(problem.objective) == Minimize and problem.is_dqcp()
 
     def invert(self, solution, inverse_data):
-        pvars = {vid: solution.primal_vars[vid] for vid in inverse_data.id_map
-                 if vid in solution.primal_vars}
-        for vid in inverse_data.id_map:
-            if vid not in pvars:
-                # Variable was optimized out because it was unconstrained.
-                pvars[vid] = 0.0
+        # Variables missing from the solution were optimized out because
+        # they were unconstrained.
+        pvars = {vid: solution.primal_vars.get(vid, 0.0)
+                 for vid in inverse_data.id_map}
         return Solution(solution.status, solution.opt_val, pvars, {},
                         solution.attr)
 
@@ -126,8 +124,8 @@ class Dqcp2Dcp(Canonicalization):
                     canon_arg.attributes["nonneg"] = True
                 elif arg.is_nonpos():
                     canon_arg.attributes["nonpos"] = True
-            canon_args += [canon_arg]
-            constrs += c
+            canon_args.append(canon_arg)
+            constrs.extend(c)
         return canon_args, constrs
 
     def _canonicalize_constraint(self, constr):
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from cvxpy.atoms import promote, reshape
+from cvxpy.atoms import reshape
 from cvxpy.expressions.constants import Constant
 from cvxpy.expressions.variable import Variable
 import numpy as np
@@ -27,7 +27,9 @@ def norm_inf_canon(expr, args):
     t = Variable(shape)
 
     if axis is None:  # shape = (1, 1)
-        promoted_t = promote(t, x.shape)
+        # The scalar t is broadcast against x by the constraints themselves,
+        # so there is no need for a Promote atom.
+        promoted_t = t
     elif axis == 0:  # shape = (1, n)
         promoted_t = Constant(np.ones((x.shape[0], 1))) @ reshape(
                                                             t, (1, x.shape[1]))
@@ -33,7 +33,9 @@ def extract_mip_idx(variables):
         """Ravel a multi-index and add a vertical offset to it.
         """
         ravel_idx = np.ravel_multi_index(multi_index, max(x.shape, (1,)), order='F')
-        return [(vert_offset + idx,) for idx in ravel_idx]
+        # Offset the whole array at once and convert to Python ints, rather
+        # than doing NumPy scalar arithmetic per index.
+        return [(idx,) for idx in (vert_offset + ravel_idx).tolist()]
     boolean_idx = []
     integer_idx = []
     vert_offset = 0
@@ -29,6 +29,7 @@ from cvxpy.reductions.utilities import (are_args_affine,
                                         group_constraints)
 import cvxpy.settings as s
 from cvxpy.utilities.coeff_extractor import CoeffExtractor
+from cvxpy.utilities import performance_utils as perf
 import numpy as np
 
 
@@ -111,30 +112,7 @@ class ParamQuadProg(ParamProb):
         self.x = x
         self.A = A
 
-        # Form a reduced representation of A, for faster application of
-        # parameters.
-        if np.prod(A.shape) != 0:
-            reduced_A, indices, indptr, shape = (
-                canonInterface.reduce_problem_data_tensor(A, self.x.size)
-            )
-            self.reduced_A = reduced_A
-            self.problem_data_index_A = (indices, indptr, shape)
-        else:
-            self.reduced_A = A
-            self.problem_data_index_A = None
         self._A_mapping_nonzero = None
-
-        # Form a reduced representation of P, for faster application of
-        # parameters.
-        if np.prod(P.shape) != 0:
-            reduced_P, indices, indptr, shape = (
-                canonInterface.reduce_problem_data_tensor(P, self.x.size, quad_form=True)
-            )
-            self.reduced_P = reduced_P
-            self.problem_data_index_P = (indices, indptr, shape)
-        else:
-            self.reduced_P = P
-            self.problem_data_index_P = None
         self._P_mapping_nonzero = None
 
         self.constraints = constraints
@@ -156,6 +134,64 @@ class ParamQuadProg(ParamProb):
         return self.x.attributes['boolean'] or \
             self.x.attributes['integer']
 
+    @perf.lazyprop
+    def _reduced_A(self):
+        """A reduced representation of A, for faster application of parameters.
+
+        Like ParamConeProg._reduced_A, this is only formed when parameters are
+        first applied.
+
+        Returns
+        -------
+        tuple
+            (reduced_A, problem_data_index_A)
+        """
+        if np.prod(self.A.shape) != 0:
+            reduced_A, indices, indptr, shape = (
+                canonInterface.reduce_problem_data_tensor(self.A, self.x.size)
+            )
+            return reduced_A, (indices, indptr, shape)
+        else:
+            return self.A, None
+
+    @perf.lazyprop
+    def _reduced_P(self):
+        """A reduced representation of P, for faster application of parameters.
+
+        Returns
+        -------
+        tuple
+            (reduced_P, problem_data_index_P)
+        """
+        if np.prod(self.P.shape) != 0:
+            reduced_P, indices, indptr, shape = (
+                canonInterface.reduce_problem_data_tensor(
+                    self.P, self.x.size, quad_form=True)
+            )
+            return reduced_P, (indices, indptr, shape)
+        else:
+            return self.P, None
+
+    @property
+    def reduced_A(self):
+        """The reduced representation of the problem data tensor A."""
+        return self._reduced_A[0]
+
+    @property
+    def problem_data_index_A(self):
+        """CSC (indices, indptr, shape) for the matrix formed from reduced_A."""
+        return self._reduced_A[1]
+
+    @property
+    def reduced_P(self):
+        """The reduced representation of the problem data tensor P."""
+        return self._reduced_P[0]
+
+    @property
+    def problem_data_index_P(self):
+        """CSC (indices, indptr, shape) for the matrix formed from reduced_P."""
+        return self._reduced_P[1]
+
     def apply_parameters(self, id_to_param_value=None, zero_offset=False,
                          keep_zeros=False):
         """Returns A, b after applying parameters (and reshaping).
@@ -168,7 +204,7 @@ class ParamQuadProg(ParamProb):
                         parameters are affected
         """
         def param_value(idx):
-            return (np.array(self.id_to_param[idx].value) if id_to_param_value
+            return (np.asarray(self.id_to_param[idx].value) if id_to_param_value
                     is None else id_to_param_value[idx])
         param_vec = canonInterface.get_parameter_vector(
             self.total_param_size,
@@ -186,9 +222,7 @@ class ParamQuadProg(ParamProb):
             with_offset=False,
             problem_data_index=self.problem_data_index_P)
 
-        q, d = canonInterface.get_matrix_from_tensor(
-            self.q, param_vec, self.x.size, with_offset=True)
-        q = q.toarray().flatten()
+        q, d = canonInterface.get_vector_from_tensor(self.q, param_vec)
         if keep_zeros and self._A_mapping_nonzero is None:
             self._A_mapping_nonzero = canonInterface.A_mapping_nonzero_rows(
                 self.A, self.x.size)
@@ -294,7 +328,7 @@ class QpMatrixStuffing(MatrixStuffing):
 
     def invert(self, solution, inverse_data):
         """Retrieves the solution to the original problem."""
-        var_map = inverse_data.var_offsets
+        var_map = inverse_data.id_map
         # Flip sign of opt val if maximize.
         opt_val = solution.opt_val
         if solution.status not in s.ERROR and not inverse_data.minimize:
@@ -307,9 +341,8 @@ class QpMatrixStuffing(MatrixStuffing):
 
         # Split vectorized variable into components.
         x_opt = list(solution.primal_vars.values())[0]
-        for var_id, offset in var_map.items():
+        for var_id, (offset, size) in var_map.items():
             shape = inverse_data.var_shapes[var_id]
-            size = np.prod(shape, dtype=int)
             primal_vars[var_id] = np.reshape(x_opt[offset:offset+size], shape,
                                              order='F')
 
@@ -120,6 +120,24 @@ class ConicSolver(Solver):
         col_arr = np.arange(num_values)
         return sp.csc_matrix((val_arr, (row_arr, col_arr)), shape)
 
+    @staticmethod
+    def soc_format_mat(constr):
+        """Return a matrix to multiply by SOC constraint coefficients.
+
+        Interleaves the rows of coeffs[0] and coeffs[1]:
+            coeffs[0][0, :]
+            coeffs[1][0:gap-1, :]
+            coeffs[0][1, :]
+            coeffs[1][gap-1:2*(gap-1), :]
+        """
+        num_cones = constr.args[0].size
+        gap = constr.args[1].shape[0] + 1
+        t_rows = np.arange(num_cones) * gap
+        X_rows = (t_rows[:, None] + np.arange(1, gap)).ravel()
+        rows = np.concatenate([t_rows, X_rows])
+        return sp.csr_matrix((np.ones(rows.size), (rows, np.arange(rows.size))),
+                             shape=(rows.size, rows.size))
+
     def psd_format_mat(self, constr):
         """Return a matrix to multiply by PSD constraint coefficients.
         """
@@ -167,27 +185,7 @@ class ConicSolver(Solver):
             elif type(constr) == SOC:
                 # Group each t row with appropriate X rows.
                 assert constr.axis == 0, 'SOC must be lowered to axis == 0'
-
-                # Interleave the rows of coeffs[0] and coeffs[1]:
-                #     coeffs[0][0, :]
-                #     coeffs[1][0:gap-1, :]
-                #     coeffs[0][1, :]
-                #     coeffs[1][gap-1:2*(gap-1), :]
-                t_spacer = ConicSolver.get_spacing_matrix(
-                    shape=(total_height, constr.args[0].size),
-                    spacing=constr.args[1].shape[0],
-                    streak=1,
-                    num_blocks=constr.args[0].size,
-                    offset=0,
-                )
-                X_spacer = ConicSolver.get_spacing_matrix(
-                    shape=(total_height, constr.args[1].size),
-                    spacing=1,
-                    streak=constr.args[1].shape[0],
-                    num_blocks=constr.args[0].size,
-                    offset=1,
-                )
-                restruct_mat.append(sp.hstack([t_spacer, X_spacer]))
+                restruct_mat.append(ConicSolver.soc_format_mat(constr))
             elif type(constr) == ExpCone:
                 arg_mats = []
                 for i, arg in enumerate(constr.args):
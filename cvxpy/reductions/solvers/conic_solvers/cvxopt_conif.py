@@ -166,12 +166,12 @@ class CVXOPT(ECOS):
         data[s.C] = intf.dense2cvxopt(data[s.C])
         var_length = data[s.C].size[0]
         if data[s.A] is None:
-            data[s.A] = np.zeros((0, var_length))
+            data[s.A] = sp.csc_matrix((0, var_length))
             data[s.B] = np.zeros((0, 1))
         data[s.A] = intf.sparse2cvxopt(data[s.A])
         data[s.B] = intf.dense2cvxopt(data[s.B])
         if data[s.G] is None:
-            data[s.G] = np.zeros((0, var_length))
+            data[s.G] = sp.csc_matrix((0, var_length))
             data[s.H] = np.zeros((0, 1))
         data[s.G] = intf.sparse2cvxopt(data[s.G])
         data[s.H] = intf.dense2cvxopt(data[s.H])
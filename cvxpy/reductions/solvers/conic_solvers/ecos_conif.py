@@ -112,17 +112,19 @@ class ECOS(ConicSolver):
         c, d, A, b = problem.apply_parameters()
         data[s.C] = c
         inv_data[s.OFFSET] = d
-        data[s.A] = -A[:len_eq]
-        if data[s.A].shape[0] == 0:
+        # ECOS accepts None for an empty block, so only slice out the
+        # equality and cone blocks that actually have rows.
+        if len_eq > 0:
+            data[s.A] = -A[:len_eq]
+            data[s.B] = b[:len_eq].flatten()
+        else:
             data[s.A] = None
-        data[s.B] = b[:len_eq].flatten()
-        if data[s.B].shape[0] == 0:
             data[s.B] = None
-        data[s.G] = -A[len_eq:]
-        if 0 in data[s.G].shape:
+        if len_eq < A.shape[0]:
+            data[s.G] = -A[len_eq:]
+            data[s.H] = b[len_eq:].flatten()
+        else:
             data[s.G] = None
-        data[s.H] = b[len_eq:].flatten()
-        if 0 in data[s.H].shape:
             data[s.H] = None
         return data, inv_data
 
@@ -56,12 +56,8 @@ def construct_intermediate_chain(problem, candidates, gp=False):
     reductions = []
     if len(problem.variables()) == 0:
         return Chain(reductions=reductions)
-    # TODO Handle boolean constraints.
-    if complex2real.accepts(problem):
-        reductions += [complex2real.Complex2Real()]
-    if gp:
-        reductions += [Dgp2Dcp()]
-
+    # Check the ruleset first, so that non-disciplined problems fail before
+    # any further work is done.
     if not gp and not problem.is_dcp():
         append = build_non_disciplined_error_msg(problem, 'DCP')
         if problem.is_dgp():
@@ -82,6 +78,12 @@ def construct_intermediate_chain(problem, candidates, gp=False):
                        "Consider calling solve() with `qcp=True`.")
         raise DGPError("Problem does not follow DGP rules." + append)
 
+    # TODO Handle boolean constraints.
+    if complex2real.accepts(problem):
+        reductions += [complex2real.Complex2Real()]
+    if gp:
+        reductions += [Dgp2Dcp()]
+
     # Dcp2Cone and Qp2SymbolicQp require problems to minimize their objectives.
     if type(problem.objective) == Maximize:
         reductions += [FlipObjective()]
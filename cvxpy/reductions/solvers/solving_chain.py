@@ -72,12 +72,8 @@ def _reductions_for_problem_class(problem, candidates, gp=False):
         Raised if the problem is not DGP and `gp` is True.
     """
     reductions = []
-    # TODO Handle boolean constraints.
-    if complex2real.accepts(problem):
-        reductions += [complex2real.Complex2Real()]
-    if gp:
-        reductions += [Dgp2Dcp()]
-
+    # Check the ruleset first, so that non-disciplined problems fail before
+    # any further work is done.
     if not gp and not problem.is_dcp():
         append = build_non_disciplined_error_msg(problem, 'DCP')
         if problem.is_dgp():
@@ -98,6 +94,12 @@ def _reductions_for_problem_class(problem, candidates, gp=False):
                        "Consider calling solve() with `qcp=True`.")
         raise DGPError("Problem does not follow DGP rules." + append)
 
+    # TODO Handle boolean constraints.
+    if complex2real.accepts(problem):
+        reductions += [complex2real.Complex2Real()]
+    if gp:
+        reductions += [Dgp2Dcp()]
+
     # Dcp2Cone and Qp2SymbolicQp require problems to minimize their objectives.
     if type(problem.objective) == Maximize:
         reductions += [FlipObjective()]
@@ -189,20 +191,22 @@ def construct_solving_chain(problem, candidates, gp=False, enforce_dpp=False):
     # problem. The types of atoms to check for are SOC atoms, PSD atoms,
     # and exponential atoms.
     atoms = problem.atoms()
+    # Collect the constraint types in a single pass over the constraints.
+    constr_types = set(type(c) for c in problem.constraints)
     cones = []
     if (any(atom in SOC_ATOMS for atom in atoms)
-            or any(type(c) == SOC for c in problem.constraints)):
+            or SOC in constr_types):
         cones.append(SOC)
     if (any(atom in EXP_ATOMS for atom in atoms)
-            or any(type(c) == ExpCone for c in problem.constraints)):
+            or ExpCone in constr_types):
         cones.append(ExpCone)
     if (any(atom in NONPOS_ATOMS for atom in atoms)
-            or any(type(c) in [Inequality, NonPos, NonNeg] for c in problem.constraints)):
+            or any(t in constr_types for t in [Inequality, NonPos, NonNeg])):
         cones.append(NonNeg)
-    if (any(type(c) in [Equality, Zero] for c in problem.constraints)):
+    if any(t in constr_types for t in [Equality, Zero]):
         cones.append(Zero)
     if (any(atom in PSD_ATOMS for atom in atoms)
-            or any(type(c) == PSD for c in problem.constraints)
+            or PSD in constr_types
             or any(v.is_psd() or v.is_nsd()
                    for v in problem.variables())):
         cones.append(PSD)
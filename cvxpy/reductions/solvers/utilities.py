@@ -26,11 +26,11 @@ def expcone_permutor(n_cones, exp_cone_order):
 
 
 def extract_dual_value(result_vec, offset, constraint):
-    value = result_vec[offset:offset + constraint.size]
-    if constraint.size == 1:
+    size = constraint.size
+    value = result_vec[offset:offset + size]
+    if size == 1:
         value = intf.scalar_value(value)
-    offset += constraint.size
-    return value, offset
+    return value, offset + size
 
 
 def get_dual_values(result_vec, parse_func, constraints):
@@ -22,6 +22,7 @@ import scipy.linalg as la
 from nose.tools import assert_raises
 
 import cvxpy as cp
+import cvxpy.settings as s
 from cvxpy.error import SolverError
 from cvxpy.reductions.solvers.defines import INSTALLED_MI_SOLVERS, INSTALLED_SOLVERS
 from cvxpy.tests.base_test import BaseTest
@@ -65,6 +66,23 @@ class TestECOS(BaseTest):
         self.assertAlmostEqual(prob.value, 1.0)
         self.assertItemsAlmostEqual(self.x.value, [0, 0])
 
+    def test_ecos_empty_blocks(self):
+        """Test that empty equality or cone blocks are passed as None.
+        """
+        prob = cp.Problem(cp.Minimize(cp.sum(self.x)), [self.x == 1])
+        data, _, _ = prob.get_problem_data(cp.ECOS)
+        self.assertIsNone(data[s.G])
+        self.assertIsNone(data[s.H])
+        prob.solve(solver=cp.ECOS)
+        self.assertAlmostEqual(prob.value, 2.0)
+        self.assertItemsAlmostEqual(self.x.value, [1, 1])
+
+        prob = cp.Problem(cp.Minimize(cp.sum(self.x)), [self.x >= 1])
+        data, _, _ = prob.get_problem_data(cp.ECOS)
+        self.assertIsNone(data[s.A])
+        self.assertIsNone(data[s.B])
+        self.assertEqual(data[s.G].shape, (2, 2))
+
     def test_ecos_lp_0(self):
         StandardTestLPs.test_lp_0(solver='ECOS')
 
@@ -14,9 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import unittest
+
 import cvxpy.interface as intf
 import numpy as np
 import scipy.sparse as sp
+from cvxpy.reductions.solvers.defines import INSTALLED_SOLVERS
 from cvxpy.tests.base_test import BaseTest
 
 
@@ -143,6 +146,21 @@ class TestInterfaces(BaseTest):
         self.assertEqual(mat[0, 1], 1j)
         self.assertEqual(mat[1, 0], -1j)
 
+    @unittest.skipUnless('CVXOPT' in INSTALLED_SOLVERS, 'CVXOPT is not installed.')
+    def test_sparse2cvxopt(self):
+        """Test conversion of SciPy sparse matrices to CVXOPT.
+        """
+        import cvxopt
+        A = sp.csc_matrix(np.array([[1., 0., 2.], [0., 0., -3.]]))
+        mat = intf.sparse2cvxopt(A)
+        self.assertEqual(mat.size, (2, 3))
+        self.assertItemsAlmostEqual(np.array(cvxopt.matrix(mat)), A.toarray())
+        # Integer data and empty matrices.
+        mat = intf.sparse2cvxopt(sp.eye(3, dtype=int))
+        self.assertEqual(mat.typecode, 'd')
+        mat = intf.sparse2cvxopt(sp.csc_matrix((0, 4)))
+        self.assertEqual(mat.size, (0, 4))
+
     def test_conversion_between_intf(self):
         """Test conversion between every pair of interfaces.
         """
@@ -16,10 +16,13 @@ limitations under the License.
 import math
 
 import cvxpy as cp
+from cvxpy.cvxcore.python import canonInterface
+import cvxpy.lin_ops.lin_op as lo
 from cvxpy.reductions.solvers.conic_solvers.scs_conif import SCS
 from cvxpy.tests.base_test import BaseTest
 
 import numpy as np
+import scipy.sparse as sp
 
 
 class TestParamConeProg(BaseTest):
@@ -101,3 +104,86 @@ class TestParamConeProg(BaseTest):
 
         problem.solve(solver=cp.SCS)
         self.assertItemsAlmostEqual(s.value, sltn_value)
+
+    def test_reduce_problem_data_tensor(self):
+        """Test that the reduced tensor reconstructs the problem data.
+        """
+        np.random.seed(0)
+        n_constr, var_length, param_size = 4, 3, 5
+        A = sp.random(n_constr * (var_length + 1), param_size, density=0.2,
+                      format='lil')
+        # Leave an entire column of the problem data matrix empty.
+        A[n_constr:2 * n_constr, :] = 0
+        A = A.tocsc()
+        reduced_A, indices, indptr, shape = (
+            canonInterface.reduce_problem_data_tensor(A, var_length))
+        self.assertEqual(shape, (n_constr, var_length + 1))
+        self.assertEqual(reduced_A.shape[0], np.unique(A.tocoo().row).size)
+
+        param_vec = np.random.randn(param_size)
+        data = sp.csc_matrix((reduced_A @ param_vec, indices, indptr),
+                             shape=shape)
+        expected = np.reshape(A @ param_vec, shape, order='F')
+        self.assertItemsAlmostEqual(data.toarray(), expected, places=8)
+
+    def test_reduced_tensor_attributes(self):
+        """Test that the lazily reduced tensors match an eager reduction.
+        """
+        x = cp.Variable(2)
+        p = cp.Parameter(2, value=[2., 3.])
+        problem = cp.Problem(cp.Minimize(cp.sum_squares(x) + cp.sum(x)),
+                             [cp.multiply(p, x) >= 1])
+        for solver in [cp.SCS, cp.OSQP]:
+            data, _, _ = problem.get_problem_data(solver=solver)
+            param_prog = data[cp.settings.PARAM_PROB]
+            reduced_A, indices, indptr, shape = (
+                canonInterface.reduce_problem_data_tensor(
+                    param_prog.A, param_prog.x.size))
+            self.assertEqual((reduced_A != param_prog.reduced_A).nnz, 0)
+            index = (param_prog.problem_data_index if solver == cp.SCS
+                     else param_prog.problem_data_index_A)
+            self.assertItemsAlmostEqual(index[0], indices)
+            self.assertItemsAlmostEqual(index[1], indptr)
+            self.assertEqual(index[2], shape)
+
+    def test_get_vector_from_tensor(self):
+        """Test the dense specialization for objective tensors.
+        """
+        x = cp.Variable(3)
+        p = cp.Parameter(3, value=[1., -2., 3.])
+        problem = cp.Problem(cp.Minimize(p @ x + 2 * cp.sum(p) + 1),
+                             [x >= 0])
+        data, _, _ = problem.get_problem_data(solver=cp.SCS)
+        param_cone_prog = data[cp.settings.PARAM_PROB]
+        c, d, _, _ = param_cone_prog.apply_parameters()
+        self.assertItemsAlmostEqual(c, p.value, places=8)
+        self.assertAlmostEqual(d, 2 * np.sum(p.value) + 1, places=8)
+        self.assertEqual(c.shape, (3,))
+
+    def test_get_parameter_vector(self):
+        """Test that parameter values are flattened in column-major order.
+        """
+        values = {1: np.arange(12.).reshape((3, 4)), 2: 5.0}
+        param_vec = canonInterface.get_parameter_vector(
+            13, {1: 0, 2: 12, lo.CONSTANT_ID: 13}, {1: 12, 2: 1},
+            lambda idx: values[idx])
+        expected = np.concatenate([values[1].flatten(order='F'), [5.0, 1.0]])
+        self.assertItemsAlmostEqual(param_vec, expected)
+
+    def test_apply_parameters_offset(self):
+        """Test that A and b are split correctly from the reduced tensor.
+        """
+        x = cp.Variable(2)
+        p = cp.Parameter(2, value=[2., 3.])
+        problem = cp.Problem(cp.Minimize(cp.sum(x)),
+                             [cp.multiply(p, x) >= 1, x[0] == p[1]])
+        data, _, _ = problem.get_problem_data(solver=cp.SCS)
+        param_cone_prog = data[cp.settings.PARAM_PROB]
+        _, _, A, b = param_cone_prog.apply_parameters()
+        param_vec = np.append(p.value, 1)
+        n_cols = param_cone_prog.x.size + 1
+        expected = np.reshape(param_cone_prog.A @ param_vec, (-1, n_cols),
+                              order='F')
+        self.assertTrue(sp.isspmatrix_csc(A))
+        self.assertItemsAlmostEqual(A.toarray(), expected[:, :-1], places=8)
+        self.assertItemsAlmostEqual(b, expected[:, -1], places=8)
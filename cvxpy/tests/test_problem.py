@@ -234,6 +234,34 @@ class TestProblem(BaseTest):
             # offsets were correctly parsed until we update the CVXOPT
             # interface.
 
+    def test_compilation_cache(self):
+        """Test that switching solvers reuses previously compiled chains.
+        """
+        p = cp.Parameter(nonneg=True, value=1.0)
+        prob = Problem(cp.Minimize(cp.norm(self.x) + p), [self.x >= p])
+        prob.solve(solver=s.ECOS)
+        ecos_chain = prob._cache.solving_chain
+        ecos_param_prog = prob._cache.param_prog
+        prob.solve(solver=s.SCS)
+        self.assertIsNot(prob._cache.solving_chain, ecos_chain)
+
+        p.value = 2.0
+        prob.solve(solver=s.ECOS)
+        self.assertIs(prob._cache.solving_chain, ecos_chain)
+        self.assertIs(prob._cache.param_prog, ecos_param_prog)
+        self.assertItemsAlmostEqual(self.x.value, [2, 2])
+        self.assertAlmostEqual(prob.value, 2 * np.sqrt(2) + 2)
+        # Only the state for the previous solver is kept.
+        self.assertEqual(prob._cache._previous[0], s.SCS)
+
+        # The default solver reuses the program compiled for it by name.
+        prob = Problem(cp.Minimize(cp.norm(self.x) + p), [self.x >= p])
+        prob.solve()
+        default_param_prog = prob._cache.param_prog
+        prob.solve(solver=prob._cache.solving_chain.solver.name())
+        self.assertIs(prob._cache.param_prog, default_param_prog)
+        self.assertIsNone(prob._cache._previous)
+
     def test_unpack_results(self):
         """Test unpack results method.
         """
@@ -114,8 +114,10 @@ class CoeffExtractor(object):
         # and obtains the Pi and qi for that entry i.
         # These are then combined into matrices [P1.flatten(), P2.flatten(), ...]
         # and [q1, q2, ...]
+        # c is kept sparse; only the rows belonging to quadratic forms are
+        # densified below.
         constant = param_coeffs[-1, :]
-        c = param_coeffs[:-1, :].A
+        c = param_coeffs[:-1, :].tocsr()
 
         # coeffs stores the P and q for each quad_form,
         # as well as for true variable nodes in the objective.
@@ -134,7 +136,7 @@ class CoeffExtractor(object):
                 orig_id = quad_forms[var_id][2].args[0].id
                 var_offset = affine_id_map[var_id][0]
                 var_size = affine_id_map[var_id][1]
-                c_part = c[var_offset:var_offset+var_size, :]
+                c_part = c[var_offset:var_offset+var_size, :].A
                 if quad_forms[var_id][2].P.value is not None:
                     # Convert to sparse matrix.
                     P = quad_forms[var_id][2].P.value
@@ -169,7 +171,7 @@ class CoeffExtractor(object):
                 else:
                     coeffs[orig_id] = dict()
                     coeffs[orig_id]['P'] = P_tup
-                    coeffs[orig_id]['q'] = np.zeros((P.shape[0], c.shape[1]))
+                    coeffs[orig_id]['q'] = sp.csr_matrix((P.shape[0], c.shape[1]))
             else:
                 var_offset = affine_id_map[var.id][0]
                 var_size = np.prod(affine_var_shapes[var.id], dtype=int)
@@ -218,7 +220,7 @@ class CoeffExtractor(object):
             if var_id in coeffs and 'q' in coeffs[var_id]:
                 q = coeffs[var_id]['q']
             else:
-                q = np.zeros((size, num_params))
+                q = sp.csr_matrix((size, num_params))
 
             P_list.append(P)
             q_list.append(q)
@@ -269,7 +271,5 @@ class CoeffExtractor(object):
         # Stitch together Ps and qs and constant.
         P = sp.coo_matrix((vals, (rows, cols)), shape=(acc_height, num_params))
         # Stack q with constant offset as last row.
-        q = np.vstack(q_list)
-        q = np.vstack([q, constant.A])
-        q = sp.csr_matrix(q)
+        q = sp.vstack(q_list + [constant], format='csr')
         return P, q